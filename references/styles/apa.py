@@ -14,28 +14,106 @@ Usage in post frontmatter:
     ---
 """
 
+from functools import lru_cache
+from operator import itemgetter
+
 from pybtex.style.formatting import BaseStyle, toplevel
 from pybtex.style.template import (
-    field, tag, optional, sentence, join, words, together, names
+    field, tag, href, optional, sentence, join, words, names,
+    node, FieldIsMissing
 )
 from pybtex.style.sorting import BaseSortingStyle
 from pybtex.plugin import register_plugin
 from pybtex.richtext import Text
 
 
+# DOI as https://doi.org/... per APA 7th edition, built from the entry's doi field
+_DOI = href(join [ 'https://doi.org/', field('doi', raw=True) ]) [
+    join [ 'https://doi.org/', field('doi', raw=True) ]
+]
+
+
 class APASortingStyle(BaseSortingStyle):
     """Sort entries alphabetically by author last name, then year."""
 
     def sorting_key(self, entry):
-        if 'author' in entry.persons:
+        # Keys are kept on the entry so later sorts of the same entries are free
+        try:
+            return entry._apa_sort_key
+        except AttributeError:
+            pass
+
+        try:
             author = entry.persons['author'][0].last_names[0]
-        elif 'editor' in entry.persons:
-            author = entry.persons['editor'][0].last_names[0]
-        else:
-            author = entry.fields.get('title', '')
+        except KeyError:
+            try:
+                author = entry.persons['editor'][0].last_names[0]
+            except KeyError:
+                author = entry.fields.get('title', '')
 
         year = entry.fields.get('year', '9999')
-        return (author.lower(), year)
+        key = (author.casefold(), year)
+        entry._apa_sort_key = key
+        return key
+
+    def sort(self, entries):
+        keyed = [(self.sorting_key(entry), entry) for entry in entries]
+        # Bibliographies are often kept in order already; one linear check skips the sort
+        if any(keyed[i][0] > keyed[i + 1][0] for i in range(len(keyed) - 1)):
+            keyed.sort(key=itemgetter(0))
+        return [entry for _, entry in keyed]
+
+
+@lru_cache(maxsize=4096)
+def _format_person_apa(last_names, first_names, middle_names):
+    """Format name parts as 'Last, F. M.', cached per unique person."""
+    last = last_names[0] if len(last_names) == 1 else ' '.join(last_names)
+    parts = []
+    for n in first_names:
+        if n:
+            parts.append(n[0])
+    for n in middle_names:
+        if n:
+            parts.append(n[0])
+    if parts:
+        return f"{last}, {'. '.join(parts)}."
+    return last
+
+
+def _editors_text(style, entry):
+    """Editor names followed by (Ed.) or (Eds.), in APA style."""
+    suffix = ' (Eds.)' if len(entry.persons['editor']) > 1 else ' (Ed.)'
+    return Text(str(style.format_names('editor', entry)) + suffix)
+
+
+@node
+def author_or_editor(children, context):
+    """Authors, or editors followed by (Ed.)/(Eds.), in APA style."""
+    entry = context['entry']
+    style = context['style']
+    if 'author' in entry.persons:
+        return style.format_names('author', entry)
+    elif 'editor' in entry.persons:
+        return _editors_text(style, entry)
+    raise FieldIsMissing('author', entry)
+
+
+@node
+def apa_editors(children, context):
+    """Editors followed by (Ed.)/(Eds.), for the book an entry appears in."""
+    entry = context['entry']
+    if 'editor' not in entry.persons:
+        raise FieldIsMissing('editor', entry)
+    return _editors_text(context['style'], entry)
+
+
+@node
+def apa_names(children, context, role):
+    """Names for the given role, formatted by the style's format_names."""
+    entry = context['entry']
+    if role not in entry.persons:
+        raise FieldIsMissing(role, entry)
+    return context['style'].format_names(role, entry)
 
 
 class APAStyle(BaseStyle):
@@ -44,32 +122,40 @@ class APAStyle(BaseStyle):
     name = 'apa'
     default_sorting_style = APASortingStyle
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Templates do not depend on the entry, so build each one only once
+        self._templates = {
+            'article': self._build_article_template(),
+            'book': self._build_book_template(),
+            'inproceedings': self._build_inproceedings_template(),
+            'misc': self._build_misc_template(),
+        }
+        self._labels = {}
+
     def format_labels(self, sorted_entries):
         """Generate author-year labels for citations."""
         for entry in sorted_entries:
-            if 'author' in entry.persons:
-                authors = entry.persons['author']
-                if len(authors) == 1:
-                    label = authors[0].last_names[0]
-                elif len(authors) == 2:
-                    label = f"{authors[0].last_names[0]} & {authors[1].last_names[0]}"
-                else:
-                    label = f"{authors[0].last_names[0]} et al."
-            else:
-                label = entry.fields.get('title', 'Unknown')[:20]
+            label = self._labels.get(entry.key)
+            if label is None:
+                label = self._labels[entry.key] = self.format_label(entry)
+            yield label
 
-            year = entry.fields.get('year', 'n.d.')
-            yield f"{label}, {year}"
-
-    def format_author_or_editor(self, entry):
-        """Format authors or editors in APA style."""
+    def format_label(self, entry):
+        """Build the author-year label for a single entry."""
         if 'author' in entry.persons:
-            return self.format_names('author', entry)
-        elif 'editor' in entry.persons:
-            editors = self.format_names('editor', entry)
-            return together [ editors, ' (Ed', optional [ 's' ], ')' ]
+            authors = entry.persons['author']
+            if len(authors) == 1:
+                label = authors[0].last_names[0]
+            elif len(authors) == 2:
+                label = f"{authors[0].last_names[0]} & {authors[1].last_names[0]}"
+            else:
+                label = f"{authors[0].last_names[0]} et al."
         else:
-            return None
+            label = entry.fields.get('title', 'Unknown')[:20]
+
+        year = entry.fields.get('year', 'n.d.')
+        return f"{label}, {year}"
 
     def format_names(self, role, entry):
         """Format author/editor names in APA style: Last, F. M."""
@@ -84,33 +170,61 @@ class APAStyle(BaseStyle):
                 formatted.append(self.format_person(persons[i]))
             formatted.append('...')
             formatted.append(self.format_person(persons[-1]))
-            return Text(', ').join(formatted)
+            return Text(', '.join(formatted))
         else:
+            # Join plain strings and wrap once rather than concatenating Text parts
             formatted = [self.format_person(person) for person in persons]
             if len(formatted) == 1:
-                return formatted[0]
+                return Text(formatted[0])
             elif len(formatted) == 2:
-                return Text(' & ').join(formatted)
+                return Text(' & '.join(formatted))
             else:
                 # Oxford comma before &
-                return Text(', ').join(formatted[:-1]) + Text(', & ') + formatted[-1]
+                return Text(', '.join(formatted[:-1]) + ', & ' + formatted[-1])
 
     def format_person(self, person):
-        """Format a single person: Last, F. M."""
-        last = ' '.join(person.last_names)
-        initials = '. '.join(n[0] for n in person.first_names + person.middle_names if n)
-        if initials:
-            return Text(f"{last}, {initials}.")
-        return Text(last)
-
-    def format_article(self, entry):
+        """Format a single person as a plain string: Last, F. M."""
+        return _format_person_apa(
+            tuple(person.last_names),
+            tuple(person.first_names),
+            tuple(person.middle_names),
+        )
+
+    def format_article(self, context):
         """
         Format journal articles in APA style.
 
         Format: Author(s). (Year). Title. Journal, Volume(Issue), pages. https://doi.org/...
         """
-        template = toplevel [
-            self.format_author_or_editor(entry),
+        return self._templates['article'].format_data(context)
+
+    def format_book(self, context):
+        """
+        Format books in APA style.
+
+        Format: Author(s). (Year). Title (Edition). Publisher. https://doi.org/...
+        """
+        return self._templates['book'].format_data(context)
+
+    def format_inproceedings(self, context):
+        """
+        Format conference proceedings in APA style.
+
+        Format: Author(s). (Year). Title. In Editor (Ed.), Conference (pp. pages). Publisher.
+        """
+        return self._templates['inproceedings'].format_data(context)
+
+    def format_misc(self, context):
+        """
+        Format miscellaneous entries (websites, datasets, etc.) in APA style.
+        """
+        return self._templates['misc'].format_data(context)
+
+    # sentence [...] leaves names ending in an initial ("Smith, J.") with a single period
+
+    def _build_article_template(self):
+        return toplevel [ join [
+            sentence [ author_or_editor ],
             ' (',
             field('year'),
             '). ',
@@ -120,19 +234,13 @@ class APAStyle(BaseStyle):
             optional [ ', ', tag('em') [ field('volume') ] ],
             optional [ '(', field('number'), ')' ],
             optional [ ', ', field('pages') ],
-            '. ',
-            optional [ self.format_doi(entry) ]
-        ]
-        return template.format_data(entry)
+            '.',
+            optional [ ' ', _DOI ]
+        ] ]
 
-    def format_book(self, entry):
-        """
-        Format books in APA style.
-
-        Format: Author(s). (Year). Title (Edition). Publisher. https://doi.org/...
-        """
-        template = toplevel [
-            self.format_author_or_editor(entry),
+    def _build_book_template(self):
+        return toplevel [ join [
+            sentence [ author_or_editor ],
             ' (',
             field('year'),
             '). ',
@@ -140,54 +248,36 @@ class APAStyle(BaseStyle):
             optional [ ' (', field('edition'), ' ed.)' ],
             '. ',
             field('publisher'),
-            optional [ '. ', self.format_doi(entry) ]
-        ]
-        return template.format_data(entry)
-
-    def format_inproceedings(self, entry):
-        """
-        Format conference proceedings in APA style.
+            '.',
+            optional [ ' ', _DOI ]
+        ] ]
 
-        Format: Author(s). (Year). Title. In Editor (Ed.), Conference (pp. pages). Publisher.
-        """
-        template = toplevel [
-            self.format_names('author', entry),
+    def _build_inproceedings_template(self):
+        return toplevel [ join [
+            sentence [ apa_names('author') ],
             ' (',
             field('year'),
             '). ',
             field('title'),
             '. In ',
-            optional [ self.format_names('editor', entry), ' (Ed.), ' ],
+            optional [ apa_editors, ', ' ],
             tag('em') [ field('booktitle') ],
             optional [ ' (pp. ', field('pages'), ')' ],
-            '. ',
-            optional [ field('publisher') ],
-            optional [ '. ', self.format_doi(entry) ]
-        ]
-        return template.format_data(entry)
+            '.',
+            optional [ ' ', field('publisher'), '.' ],
+            optional [ ' ', _DOI ]
+        ] ]
 
-    def format_misc(self, entry):
-        """
-        Format miscellaneous entries (websites, datasets, etc.) in APA style.
-        """
-        template = toplevel [
-            optional [ self.format_author_or_editor(entry), '. ' ],
+    def _build_misc_template(self):
+        return toplevel [ join [
+            optional [ sentence [ author_or_editor ], ' ' ],
             optional [ '(', field('year'), '). ' ],
             tag('em') [ field('title') ],
             optional [ ' [', field('howpublished'), ']' ],
-            '. ',
-            optional [ field('publisher'), '. ' ],
-            optional [ field('url') ]
-        ]
-        return template.format_data(entry)
-
-    def format_doi(self, entry):
-        """Format DOI as https://doi.org/... per APA 7th edition."""
-        if 'doi' in entry.fields:
-            doi = entry.fields['doi']
-            url = f'https://doi.org/{doi}'
-            return tag('a', href=url) [ url ]
-        return None
+            '.',
+            optional [ ' ', field('publisher'), '.' ],
+            optional [ ' ', field('url') ]
+        ] ]
 
 
 # Register the APA style plugin
@@ -16,104 +16,126 @@ Usage in post frontmatter:
 from pybtex.style.formatting.unsrt import Style as UnsrtStyle
 from pybtex.style.formatting import toplevel
 from pybtex.style.template import (
-    field, tag, optional, sentence, join, words, together
+    field, tag, href, optional, join, words, together
 )
 from pybtex.plugin import register_plugin
 
 
+# DOI hyperlink, built from the entry's doi field
+_DOI = href(join [ 'https://doi.org/', field('doi', raw=True) ]) [ field('doi', raw=True) ]
+
+
 class IEEEStyle(UnsrtStyle):
     """IEEE citation style - numbered citations in square brackets."""
 
     name = 'ieee'
     default_sorting_style = 'none'  # Sort by order of appearance
 
+    def __init__(self, abbreviate_names=True, **kwargs):
+        # IEEE lists authors with initials: J. Smith
+        super().__init__(abbreviate_names=abbreviate_names, **kwargs)
+        self._templates = {
+            'article': self._build_article_template(),
+            'book': self._build_book_template(),
+            'inproceedings': self._build_inproceedings_template(),
+            'misc': self._build_misc_template(),
+        }
+
     def format_labels(self, sorted_entries):
         """Generate numeric labels for citations."""
         for number, entry in enumerate(sorted_entries, start=1):
             yield f"[{number}]"
 
-    def format_article(self, entry):
+    def format_doi(self, e):
+        """DOI link used by the inherited unsrt templates (reports, theses, ...)."""
+        return _DOI
+
+    def get_article_template(self, e):
         """
         Format journal articles.
 
         Format: Author(s), "Article Title," Journal Name, vol. X, no. Y, pp. Z-Z, Year.
         """
-        template = toplevel [
-            self.format_names('author'),
-            ', ',
-            sentence [ '"', field('title'), '"' ],
+        return self._templates['article']
+
+    def get_book_template(self, e):
+        """
+        Format books.
+
+        Format: Author(s), Book Title, Edition. City: Publisher, Year.
+        """
+        return self._templates['book']
+
+    def get_inproceedings_template(self, e):
+        """
+        Format conference proceedings.
+
+        Format: Author(s), "Paper Title," in Conference Name, Year, pp. Z-Z.
+        """
+        return self._templates['inproceedings']
+
+    def get_misc_template(self, e):
+        """
+        Format miscellaneous entries (websites, datasets, software, etc.).
+        """
+        return self._templates['misc']
+
+    def _build_article_template(self):
+        return toplevel [ join [
+            self.format_names('author', as_sentence=False),
+            ', "',
+            field('title'),
+            ',"',
+            ' ',
             tag('em') [ field('journal') ],
             optional [ ', vol. ', field('volume') ],
             optional [ ', no. ', field('number') ],
             optional [ ', pp. ', field('pages') ],
             ', ',
             field('year'),
-            optional [ ', doi: ', self.format_doi(entry) ],
+            optional [ ', doi: ', _DOI ],
             '.'
-        ]
-        return template.format_data(entry)
-
-    def format_book(self, entry):
-        """
-        Format books.
+        ] ]
 
-        Format: Author(s), Book Title, Edition. City: Publisher, Year.
-        """
-        template = toplevel [
-            self.format_names('author'),
+    def _build_book_template(self):
+        return toplevel [ join [
+            self.format_names('author', as_sentence=False),
             ', ',
             tag('em') [ field('title') ],
-            optional [ ', ', field('edition'), ' ed.' ],
+            optional [ ', ', field('edition'), ' ed' ],
             '. ',
             optional [ field('address'), ': ' ],
             field('publisher'),
             ', ',
             field('year'),
             '.'
-        ]
-        return template.format_data(entry)
-
-    def format_inproceedings(self, entry):
-        """
-        Format conference proceedings.
-
-        Format: Author(s), "Paper Title," in Conference Name, Year, pp. Z-Z.
-        """
-        template = toplevel [
-            self.format_names('author'),
-            ', ',
-            sentence [ '"', field('title'), '"' ],
-            'in ',
+        ] ]
+
+    def _build_inproceedings_template(self):
+        return toplevel [ join [
+            self.format_names('author', as_sentence=False),
+            ', "',
+            field('title'),
+            ',"',
+            ' in ',
             tag('em') [ field('booktitle') ],
             ', ',
             field('year'),
             optional [ ', pp. ', field('pages') ],
-            optional [ ', doi: ', self.format_doi(entry) ],
+            optional [ ', doi: ', _DOI ],
             '.'
-        ]
-        return template.format_data(entry)
-
-    def format_misc(self, entry):
-        """
-        Format miscellaneous entries (websites, datasets, software, etc.).
-        """
-        template = toplevel [
-            optional [ self.format_names('author'), ', ' ],
-            sentence [ field('title') ],
-            optional [ field('howpublished'), ', ' ],
-            optional [ field('year') ],
+        ] ]
+
+    def _build_misc_template(self):
+        return toplevel [ join [
+            optional [ self.format_names('author', as_sentence=False), ', ' ],
+            field('title'),
+            optional [ ', ', field('howpublished') ],
+            optional [ ', ', field('year') ],
             optional [ '. Available: ', field('url') ],
-            optional [ '. Accessed: ', field('note') ],
+            optional [ '. ', field('note') ],
             '.'
-        ]
-        return template.format_data(entry)
-
-    def format_doi(self, entry):
-        """Format DOI as a hyperlink."""
-        if 'doi' in entry.fields:
-            doi = entry.fields['doi']
-            return tag('a', href=f'https://doi.org/{doi}') [ doi ]
-        return None
+        ] ]
 
 
 # Register the IEEE style plugin
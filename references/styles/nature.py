@@ -14,21 +14,64 @@ Usage in post frontmatter:
     ---
 """
 
+from functools import lru_cache
+
 from pybtex.style.formatting.unsrt import Style as UnsrtStyle
 from pybtex.style.formatting import toplevel
 from pybtex.style.template import (
-    field, tag, optional, sentence, join, words, together
+    field, tag, href, optional, sentence, join, words,
+    node, FieldIsMissing
 )
 from pybtex.plugin import register_plugin
 from pybtex.richtext import Text
 
 
+@lru_cache(maxsize=4096)
+def _format_person_nature(last_names, first_names, middle_names):
+    """Format name parts as 'Last, F. M.', cached per unique person."""
+    last = last_names[0] if len(last_names) == 1 else ' '.join(last_names)
+    parts = []
+    for n in first_names:
+        if n:
+            parts.append(n[0])
+    for n in middle_names:
+        if n:
+            parts.append(n[0])
+    if parts:
+        return f"{last}, {'. '.join(parts)}."
+    return last
+
+
+@node
+def nature_names(children, context, role):
+    """Names for the given role, formatted by the style's format_names_nature."""
+    entry = context['entry']
+    if role not in entry.persons:
+        raise FieldIsMissing(role, entry)
+    return context['style'].format_names_nature(role, entry)
+
+
+# DOI hyperlink, built from the entry's doi field
+_DOI = href(join [ 'https://doi.org/', field('doi', raw=True) ]) [
+    join [ 'doi:', field('doi', raw=True) ]
+]
+
+
 class NatureStyle(UnsrtStyle):
     """Nature journal citation style - superscript numbered citations."""
 
     name = 'nature'
     default_sorting_style = 'none'  # Sort by order of appearance
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._templates = {
+            'article': self._build_article_template(),
+            'book': self._build_book_template(),
+            'inproceedings': self._build_inproceedings_template(),
+            'misc': self._build_misc_template(),
+        }
+
     def format_labels(self, sorted_entries):
         """Generate superscript numeric labels for citations."""
         for number, entry in enumerate(sorted_entries, start=1):
@@ -49,58 +92,80 @@ class NatureStyle(UnsrtStyle):
         persons = entry.persons[role]
         max_authors = 5
 
-        formatted_authors = []
-        for i, person in enumerate(persons[:max_authors]):
-            last = ' '.join(person.last_names)
-            initials = '. '.join(n[0] for n in person.first_names + person.middle_names if n)
-            if initials:
-                formatted_authors.append(f"{last}, {initials}.")
-            else:
-                formatted_authors.append(last)
+        formatted_authors = [
+            _format_person_nature(
+                tuple(person.last_names),
+                tuple(person.first_names),
+                tuple(person.middle_names),
+            )
+            for person in persons[:max_authors]
+        ]
 
+        # Build the whole list as a plain string and wrap it in Text once
         if len(persons) > max_authors:
-            author_list = Text(', ').join(Text(a) for a in formatted_authors)
-            return together [ author_list, Text(' et al.') ]
+            return Text(', '.join(formatted_authors) + ' et al.')
         else:
             if len(formatted_authors) == 1:
                 return Text(formatted_authors[0])
             elif len(formatted_authors) == 2:
-                return Text(' & ').join(Text(a) for a in formatted_authors)
+                return Text(formatted_authors[0] + ' & ' + formatted_authors[1])
             else:
-                all_but_last = Text(', ').join(Text(a) for a in formatted_authors[:-1])
-                return together [ all_but_last, Text(' & '), Text(formatted_authors[-1]) ]
+                all_but_last = ', '.join(formatted_authors[:-1])
+                return Text(all_but_last + ' & ' + formatted_authors[-1])
+
+    def format_doi(self, e):
+        """DOI link used by the inherited unsrt templates (reports, theses, ...)."""
+        return _DOI
 
-    def format_article(self, entry):
+    def get_article_template(self, e):
         """
         Format journal articles in Nature style.
 
         Format: Authors. Title. Journal vol, pages (year).
         """
-        template = toplevel [
-            self.format_names_nature('author', entry),
-            '. ',
-            field('title'),
-            '. ',
-            tag('em') [ field('journal') ],
-            ' ',
-            tag('strong') [ field('volume') ],
-            optional [ ', ', field('pages') ],
-            ' (',
-            field('year'),
-            ').',
-            optional [ ' ', self.format_doi(entry) ]
-        ]
-        return template.format_data(entry)
+        return self._templates['article']
 
-    def format_book(self, entry):
+    def get_book_template(self, e):
         """
         Format books in Nature style.
 
         Format: Authors. Title (Publisher, year).
         """
-        template = toplevel [
-            self.format_names_nature('author', entry),
-            '. ',
+        return self._templates['book']
+
+    def get_inproceedings_template(self, e):
+        """
+        Format conference proceedings in Nature style.
+        """
+        return self._templates['inproceedings']
+
+    def get_misc_template(self, e):
+        """
+        Format miscellaneous entries in Nature style.
+        """
+        return self._templates['misc']
+
+    # The pieces are joined directly; toplevel's own separator would split them into blocks
+
+    def _build_article_template(self):
+        return toplevel [ join [
+            sentence [ nature_names('author') ],
+            ' ',
+            sentence [ field('title') ],
+            ' ',
+            tag('em') [ field('journal') ],
+            optional [ ' ', tag('strong') [ field('volume') ] ],
+            optional [ ', ', field('pages') ],
+            ' (',
+            field('year'),
+            ').',
+            optional [ ' ', _DOI ]
+        ] ]
+
+    def _build_book_template(self):
+        return toplevel [ join [
+            sentence [ nature_names('author') ],
+            ' ',
             tag('em') [ field('title') ],
             optional [ ' (', field('edition'), ' edn)' ],
             ' (',
@@ -108,49 +173,32 @@ class NatureStyle(UnsrtStyle):
             ', ',
             field('year'),
             ').',
-            optional [ ' ', self.format_doi(entry) ]
-        ]
-        return template.format_data(entry)
+            optional [ ' ', _DOI ]
+        ] ]
 
-    def format_inproceedings(self, entry):
-        """
-        Format conference proceedings in Nature style.
-        """
-        template = toplevel [
-            self.format_names_nature('author', entry),
-            '. ',
-            field('title'),
-            '. in ',
+    def _build_inproceedings_template(self):
+        return toplevel [ join [
+            sentence [ nature_names('author') ],
+            ' ',
+            sentence [ field('title') ],
+            ' in ',
             tag('em') [ field('booktitle') ],
             optional [ ', ', field('pages') ],
             ' (',
             field('year'),
             ').',
-            optional [ ' ', self.format_doi(entry) ]
-        ]
-        return template.format_data(entry)
+            optional [ ' ', _DOI ]
+        ] ]
 
-    def format_misc(self, entry):
-        """
-        Format miscellaneous entries in Nature style.
-        """
-        template = toplevel [
-            optional [ self.format_names_nature('author', entry), '. ' ],
+    def _build_misc_template(self):
+        return toplevel [ join [
+            optional [ sentence [ nature_names('author') ], ' ' ],
             tag('em') [ field('title') ],
             optional [ '. ', field('howpublished') ],
             optional [ ' (', field('year'), ')' ],
             optional [ '. ', field('url') ],
             '.'
-        ]
-        return template.format_data(entry)
-
-    def format_doi(self, entry):
-        """Format DOI as a hyperlink."""
-        if 'doi' in entry.fields:
-            doi = entry.fields['doi']
-            url = f'https://doi.org/{doi}'
-            return tag('a', href=url) [ f'doi:{doi}' ]
-        return None
+        ] ]
 
 
 # Register the Nature style plugin
@@ -0,0 +1,163 @@
+"""
+Helpers shared by the blog scripts: frontmatter reading, date parsing,
+JSON loading and the post metadata caches.
+
+The scripts are run as `python scripts/<name>.py`, which puts this
+directory on sys.path, so they import this module directly.
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:
+    print("❌ Error: PyYAML package not found")
+    print("Please install it: pip install PyYAML")
+    sys.exit(1)
+
+# orjson is optional; when installed it parses JSON faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# "---" lines delimiting YAML frontmatter; parsed with libyaml's C loader when available
+_FRONTMATTER_BOUNDARY_RE = re.compile(r'^-{3,}\s*$')
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# strptime directives that only match letters or only match digits; used to
+# rule out formats by a date string's first character without calling strptime
+_ALPHA_DIRECTIVES = frozenset('aAbBp')
+_DIGIT_DIRECTIVES = frozenset('dmyYHIMSjUW')
+
+
+def read_json(path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def skip_frontmatter(f) -> Optional[List[str]]:
+    """
+    Move an open markdown file past its frontmatter, returning the header lines.
+
+    Follows python-frontmatter: leading blank lines are ignored, and a block
+    that is never closed is content. A file without frontmatter is left
+    positioned at its start and None is returned.
+    """
+    first_line = f.readline()
+    while first_line and not first_line.strip():
+        first_line = f.readline()
+    if not _FRONTMATTER_BOUNDARY_RE.match(first_line.lstrip()):
+        f.seek(0)
+        return None
+
+    header = []
+    for line in f:
+        if _FRONTMATTER_BOUNDARY_RE.match(line):
+            return header
+        header.append(line)
+
+    f.seek(0)
+    return None
+
+
+def read_frontmatter(f) -> Dict[str, Any]:
+    """Parse the frontmatter of an open markdown file, leaving it positioned at the content."""
+    # Only the header goes through YAML; the body is left for the caller to read
+    header = skip_frontmatter(f)
+    if not header:
+        return {}
+
+    metadata = yaml.load(''.join(header), Loader=_YAML_LOADER)
+    return metadata if isinstance(metadata, dict) else {}
+
+
+@lru_cache(maxsize=None)
+def _format_signature(date_format: str) -> Tuple[Optional[bool], str]:
+    """Return (starts with a letter?, literal non-space characters) for a strptime format.
+
+    The first item is None when the format's start can't be classified.
+    """
+    starts_alpha = None
+    if date_format[:1] == '%' and len(date_format) > 1:
+        if date_format[1] in _ALPHA_DIRECTIVES:
+            starts_alpha = True
+        elif date_format[1] in _DIGIT_DIRECTIVES:
+            starts_alpha = False
+
+    literals = []
+    i = 0
+    while i < len(date_format):
+        if date_format[i] == '%':
+            i += 2
+            continue
+        if not date_format[i].isspace():
+            literals.append(date_format[i].lower())
+        i += 1
+    return starts_alpha, ''.join(literals)
+
+
+def _could_match(date_str: str, date_format: str) -> bool:
+    """Cheap check that rules out formats strptime would certainly reject."""
+    starts_alpha, literals = _format_signature(date_format)
+    if starts_alpha is not None and date_str[:1].isalpha() != starts_alpha:
+        return False
+    lowered = date_str.lower()
+    return all(c in lowered for c in literals)
+
+
+@lru_cache(maxsize=None)
+def parse_date_with_formats(date_str: str, supported_formats: Tuple[str, ...]) -> Optional[datetime]:
+    """
+    Parse a date with the first matching format, or return None.
+
+    Formats are always tried in configured order: a date like 02/03/2021
+    matches both %d/%m/%Y and %m/%d/%Y, so the first listed must win.
+    """
+    for date_format in supported_formats:
+        # Skip formats whose shape can't fit, instead of raising and catching ValueError
+        if not _could_match(date_str, date_format):
+            continue
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def load_json_cache(path: Path) -> Dict[str, Any]:
+    """Load a metadata cache, or an empty one if it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json_cache(path: Path, cache: Dict[str, Any]):
+    """Write a metadata cache; a failed write only prints a warning."""
+    # Write to a temporary file first so a failed write never leaves a truncated cache
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"⚠️  Warning: Could not write {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -6,26 +6,34 @@ Supports both frontmatter and legacy format.
 """
 
 import json
+import os
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-try:
-    import frontmatter
-except ImportError:
-    print("❌ Error: python-frontmatter package not found")
-    print("Please install it: pip install python-frontmatter")
-    sys.exit(1)
+from blog_utils import (
+    load_json_cache, parse_date_with_formats, read_frontmatter, read_json, save_json_cache
+)
+
+# Title heading and legacy "*Published: DATE*" line, compiled once per run
+_TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+_DATE_RE = re.compile(r'\*(?:Published: )?(.+?)\*')
+
+# Markdown files in posts/ that are not blog posts
+SKIP_POST_FILES = frozenset({'references.md', 'README.md'})
+
+# Extracted post metadata keyed by path, reused while a post's mtime and size are unchanged
+POSTS_CACHE_PATH = Path('.posts_cache.json')
 
 
 def load_config() -> Dict[str, Any]:
     """Load blog configuration from blog_config.json"""
     try:
-        with open('blog_config.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        return config
+        return read_json('blog_config.json')
     except FileNotFoundError:
         print("⚠️  Warning: blog_config.json not found, using default values")
         return {
@@ -60,25 +68,57 @@ def extract_post_metadata(file_path: Path, config: Dict[str, Any]) -> Optional[D
     """Extract title, date, and description from a markdown file with frontmatter support."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
-
-        # Try to get metadata from frontmatter first
-        title = post.get('title')
-        date_str = post.get('date')
-        description = post.get('description')
+            metadata = read_frontmatter(f)
+
+            # Try to get metadata from frontmatter first
+            title = metadata.get('title')
+            date_str = metadata.get('date')
+            description = metadata.get('description')
+
+            # Fallback to content parsing for whatever frontmatter is missing.
+            # Title, legacy *DATE* line and first paragraph all sit at the top of
+            # a post, so keep reading the same file only until nothing is left to
+            # find; the tail of long posts is never read.
+            need_title = not title
+            need_date = not date_str
+            need_description = not description
+            description_length = get_nested_value(config, 'posts', 'description_length', default=150)
 
-        # Fallback to content parsing if frontmatter is missing
-        content = post.content
+            start_looking = False
+            for line in f:
+                if not (need_title or need_date or need_description):
+                    break
+                line = line.rstrip('\n')
+
+                # Cheap literal checks rule out most lines before the regex engine runs
+                if need_title and line.startswith('# '):
+                    title_match = _TITLE_RE.match(line)
+                    if title_match:
+                        title = title_match.group(1)
+                        need_title = False
+
+                if need_date and '*' in line:
+                    date_match = _DATE_RE.search(line)
+                    if date_match:
+                        date_str = date_match.group(1)
+                        need_date = False
+
+                if need_description:
+                    # Skip title, date, and empty lines to find first paragraph
+                    line = line.strip()
+                    if start_looking and line and not line.startswith('#') and not line.startswith('*') and not line.startswith('```'):
+                        # Take first sentence or configured length
+                        description = line
+                        if '.' in description:
+                            description = description.split('.')[0] + '.'
+                        elif len(description) > description_length:
+                            description = description[:description_length] + '...'
+                        need_description = False
+                    elif line.startswith('# '):
+                        start_looking = True
 
-        # Extract title if not in frontmatter
         if not title:
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            title = title_match.group(1) if title_match else file_path.stem.replace('-', ' ').title()
-
-        # Extract date if not in frontmatter (legacy format: *DATE*)
-        if not date_str:
-            date_match = re.search(r'\*(?:Published: )?(.+?)\*', content)
-            date_str = date_match.group(1) if date_match else None
+            title = file_path.stem.replace('-', ' ').title()
 
         if not date_str:
             print(f"⚠️  Warning: No date found in {file_path.name}, skipping post")
@@ -90,26 +130,6 @@ def extract_post_metadata(file_path: Path, config: Dict[str, Any]) -> Optional[D
         else:
             date_str = str(date_str)
 
-        # Extract description if not in frontmatter
-        if not description:
-            description_length = get_nested_value(config, 'posts', 'description_length', default=150)
-            lines = content.split('\n')
-
-            # Skip title, date, and empty lines to find first paragraph
-            start_looking = False
-            for line in lines:
-                line = line.strip()
-                if start_looking and line and not line.startswith('#') and not line.startswith('*') and not line.startswith('```'):
-                    # Take first sentence or configured length
-                    description = line
-                    if '.' in description:
-                        description = description.split('.')[0] + '.'
-                    elif len(description) > description_length:
-                        description = description[:description_length] + '...'
-                    break
-                elif line.startswith('# '):
-                    start_looking = True
-
         # If no description found, create a generic one
         if not description:
             description = f"Explore insights about {title.lower()}."
@@ -132,16 +152,11 @@ def parse_date(date_str: str, config: Dict[str, Any]) -> datetime:
         config, 'posts', 'supported_date_formats',
         default=["%B %d, %Y", "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"]
     )
-
-    for date_format in supported_formats:
-        try:
-            return datetime.strptime(date_str, date_format)
-        except ValueError:
-            continue
-
-    # If no format matches, print warning and return min date
-    print(f"⚠️  Warning: Could not parse date '{date_str}' with any supported format")
-    return datetime.min
+    parsed = parse_date_with_formats(date_str, tuple(supported_formats))
+    if parsed is None:
+        print(f"⚠️  Warning: Could not parse date '{date_str}' with any supported format")
+        return datetime.min
+    return parsed
 
 
 def generate_posts_section(config: Dict[str, Any]) -> str:
@@ -152,21 +167,58 @@ def generate_posts_section(config: Dict[str, Any]) -> str:
         print(f"❌ Error: posts/ directory not found")
         return "## Recent Posts\n\n*No posts found.*\n\n"
 
+    cache = load_json_cache(POSTS_CACHE_PATH)
+    description_length = get_nested_value(config, 'posts', 'description_length', default=150)
+
+    # Scan for markdown files in posts directory; scandir hands back stat info
+    # so unchanged posts can be served from the cache without being reopened
+    scanned = []
+    with os.scandir(posts_dir) as it:
+        for entry in it:
+            if not entry.name.endswith('.md') or not entry.is_file():
+                continue
+            if entry.name in SKIP_POST_FILES:
+                continue
+            stat = entry.stat()
+            cached = cache.get(entry.path)
+            if (cached and cached.get('mtime') == stat.st_mtime_ns and cached.get('size') == stat.st_size
+                    and cached.get('description_length') == description_length):
+                metadata = dict(cached['meta'], file_path=Path(entry.path))
+            else:
+                metadata = None
+            scanned.append((Path(entry.path), stat, metadata))
+
+    # Posts are independent and extraction is mostly file I/O, so read them concurrently
+    stale_paths = [path for path, _, metadata in scanned if metadata is None]
+    with ThreadPoolExecutor() as executor:
+        extracted = iter(list(executor.map(lambda path: extract_post_metadata(path, config), stale_paths)))
+
     posts = []
+    new_cache = {}
+    for path, stat, metadata in scanned:
+        if metadata is None:
+            metadata = next(extracted)
+        if metadata:  # Only keep successful extractions
+            posts.append(metadata)
+            new_cache[str(path)] = {
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'description_length': description_length,
+                # Frontmatter values may be dates or numbers; the index only uses their text
+                'meta': {key: str(metadata[key]) for key in ('title', 'date', 'description')}
+            }
 
-    # Scan for markdown files in posts directory
-    for file_path in posts_dir.glob('*.md'):
-        if file_path.name not in ['references.md', 'README.md']:  # Skip reference files
-            metadata = extract_post_metadata(file_path, config)
-            if metadata:  # Only add if extraction succeeded
-                posts.append(metadata)
+    if new_cache != cache:
+        save_json_cache(POSTS_CACHE_PATH, new_cache)
 
     if not posts:
         print("⚠️  Warning: No valid posts found in posts/ directory")
         return "## Recent Posts\n\n*No posts found. Add markdown files with dates to the posts/ directory.*\n\n"
 
-    # Sort posts by date (newest first)
-    posts.sort(key=lambda x: parse_date(x['date'], config), reverse=True)
+    # Parse each post's date once, then sort by it (newest first)
+    for post in posts:
+        post['date_dt'] = parse_date(post['date'], config)
+    posts.sort(key=itemgetter('date_dt'), reverse=True)
 
     # Limit posts if configured
     max_posts = get_nested_value(config, 'posts', 'max_posts_on_homepage', default=0)
@@ -174,16 +226,25 @@ def generate_posts_section(config: Dict[str, Any]) -> str:
         posts = posts[:max_posts]
 
     # Generate markdown
-    posts_md = "## Recent Posts\n\n"
+    parts = ["## Recent Posts\n\n"]
 
     for post in posts:
         relative_path = f"posts/{post['file_path'].name}"
-        posts_md += f"### [{post['title']}]({relative_path})\n"
-        posts_md += f"*{post['date']}*\n\n"
-        posts_md += f"{post['description']}\n\n"
-        posts_md += "---\n\n"
+        parts.append(
+            f"### [{post['title']}]({relative_path})\n"
+            f"*{post['date']}*\n\n"
+            f"{post['description']}\n\n"
+            "---\n\n"
+        )
+
+    posts_md = ''.join(parts)
+
+    # Drop only the trailing separator; rstrip('---\n\n') would also eat
+    # dashes at the end of the last description
+    if posts_md.endswith('---\n\n'):
+        posts_md = posts_md[:-len('---\n\n')]
 
-    return posts_md.rstrip('---\n\n') + "\n\n"
+    return posts_md.rstrip('\n') + "\n\n"
 
 
 def update_index_md():
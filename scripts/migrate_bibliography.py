@@ -6,13 +6,76 @@ Helps users migrate from the old book/references.bib structure
 to the new references/ directory structure.
 """
 
+import argparse
+import errno
+import os
 import sys
 from pathlib import Path
 import shutil
 
 
-def migrate_bibliography():
-    """Interactive migration to new bibliography structure."""
+def _copy_contents(fsrc, fdst):
+    """Copy an open file's bytes in-kernel where possible.
+
+    copy_file_range can clone extents on copy-on-write filesystems;
+    sendfile avoids userspace buffers; copyfileobj is the portable fallback.
+    """
+    size = os.fstat(fsrc.fileno()).st_size
+    copied = 0
+    try:
+        while copied < size:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+            if n == 0:
+                break
+            copied += n
+        return
+    except (AttributeError, OSError):
+        if copied:
+            raise
+    try:
+        while copied < size:
+            n = os.sendfile(fdst.fileno(), fsrc.fileno(), copied, size - copied)
+            if n == 0:
+                break
+            copied += n
+        return
+    except (AttributeError, OSError):
+        if copied:
+            raise
+    shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+
+
+def _copy(src: Path, dst: Path):
+    """Copy file contents and permission/timestamp metadata from src to dst."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        _copy_contents(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _fast_move(src: Path, dst: Path):
+    """Move src to dst, renaming in place when both are on the same filesystem."""
+    try:
+        if src.stat().st_dev == dst.parent.stat().st_dev:
+            os.replace(src, dst)
+            return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # Different filesystems: copy the bytes over, then drop the original
+    _copy(src, dst)
+    src.unlink()
+
+
+def migrate_bibliography(move: bool = False):
+    """Interactive migration to new bibliography structure.
+
+    Files are copied by default so the old book/ directory stays intact;
+    with move=True they are moved instead.
+    """
+    transfer = _fast_move if move else _copy
+    verb = "Moved" if move else "Migrated"
+
     print("📚 Bibliography Migration Tool")
     print("=" * 50)
     print()
@@ -29,10 +92,21 @@ def migrate_bibliography():
         print("✅ No migration needed - you're already using the new structure!")
         return
 
+    # Sort the old posts directory into markdown and .bib files in one pass
+    md_files = []
+    bib_files = []
+    if old_posts.exists():
+        with os.scandir(old_posts) as it:
+            for entry in it:
+                if entry.name.endswith('.md'):
+                    md_files.append(Path(entry.path))
+                elif entry.name.endswith('.bib'):
+                    bib_files.append(Path(entry.path))
+
     print("📋 Found old structure to migrate:")
     if old_bib.exists():
         print(f"   - {old_bib}")
-    if old_posts.exists() and list(old_posts.glob('*.md')):
+    if md_files:
         print(f"   - {old_posts}/*.md files")
     print()
 
@@ -57,33 +131,30 @@ def migrate_bibliography():
         new_bib = new_refs_dir / 'global.bib'
         if new_bib.exists():
             backup = new_refs_dir / 'global.bib.backup'
-            shutil.copy(new_bib, backup)
+            os.replace(new_bib, backup)
             print(f"📦 Backed up existing {new_bib} to {backup}")
 
-        shutil.copy(old_bib, new_bib)
-        print(f"✅ Migrated {old_bib} → {new_bib}")
+        transfer(old_bib, new_bib)
+        print(f"✅ {verb} {old_bib} → {new_bib}")
 
     # Migrate blog posts
     if old_posts.exists():
-        md_files = list(old_posts.glob('*.md'))
-        bib_files = list(old_posts.glob('*.bib'))
-
         for md_file in md_files:
             if md_file.name not in ['README.md', 'references.md']:
                 new_file = new_posts / md_file.name
                 if new_file.exists():
                     backup = new_posts / f"{md_file.stem}.backup.md"
-                    shutil.copy(new_file, backup)
+                    os.replace(new_file, backup)
                     print(f"📦 Backed up {new_file} to {backup}")
 
-                shutil.copy(md_file, new_file)
-                print(f"✅ Migrated {md_file} → {new_file}")
+                transfer(md_file, new_file)
+                print(f"✅ {verb} {md_file} → {new_file}")
 
         for bib_file in bib_files:
             if bib_file.name != 'references.bib':
                 new_file = new_posts / bib_file.name
-                shutil.copy(bib_file, new_file)
-                print(f"✅ Migrated {bib_file} → {new_file}")
+                transfer(bib_file, new_file)
+                print(f"✅ {verb} {bib_file} → {new_file}")
 
     print()
     print("=" * 50)
@@ -96,9 +167,14 @@ def migrate_bibliography():
     print("4. Run: python scripts/generate_posts.py")
     print("5. Build: jupyter-book build .")
     print()
-    print("💡 The old book/ directory is preserved for safety.")
-    print("   You can delete it once you've verified the migration.")
+    if not move:
+        print("💡 The old book/ directory is preserved for safety.")
+        print("   You can delete it once you've verified the migration.")
 
 
 if __name__ == "__main__":
-    migrate_bibliography()
+    parser = argparse.ArgumentParser(description="Migrate to the references/ and posts/ structure.")
+    parser.add_argument('--move', action='store_true',
+                        help="move files out of book/ instead of copying them")
+    args = parser.parse_args()
+    migrate_bibliography(move=args.move)
@@ -4,18 +4,104 @@ Interactive setup script for customizing your Jupyter Book blog.
 Run this after forking the template to personalize your blog.
 """
 
+import argparse
+import contextlib
+import importlib
+import io
 import json
+import subprocess
+import sys
 from pathlib import Path
 
-def get_user_input(prompt, default=""):
+# orjson is optional; when installed it reads and writes blog_config.json faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+def run_script(name, entry_point, quiet=False):
+    """Run a sibling script's entry point in this interpreter.
+
+    Returns (success, output); output is only collected when quiet is True.
+    Falls back to running the script in a subprocess if it can't be imported.
+    """
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+
+    try:
+        func = getattr(importlib.import_module(name), entry_point)
+    except (ImportError, AttributeError, SystemExit):
+        result = subprocess.run([sys.executable, str(SCRIPTS_DIR / f'{name}.py')],
+                                capture_output=quiet, text=True)
+        return result.returncode == 0, result.stderr if quiet else ''
+
+    buffer = io.StringIO()
+    redirect = contextlib.redirect_stdout(buffer) if quiet else contextlib.nullcontext()
+    try:
+        with redirect:
+            func()
+    except SystemExit as e:
+        return e.code in (None, 0), buffer.getvalue()
+    except Exception as e:
+        if not quiet:
+            print(f"❌ Error running {name}: {e}")
+        return False, buffer.getvalue() + str(e)
+    return True, buffer.getvalue()
+
+# Setup questions grouped by section: (heading, underline width, fields).
+# Each field is (answer name, prompt, key path into an existing config, default);
+# defaults may refer to earlier answers with str.format placeholders.
+SETUP_PROMPTS = [
+    ("📖 BLOG INFORMATION", 20, [
+        ('blog_title', "Blog title", ('blog', 'title'), 'My Technical Blog'),
+        ('blog_description', "Blog description", ('blog', 'description'),
+         'A technical blog powered by Jupyter Book'),
+        ('author_name', "Author name", ('blog', 'author'), 'Your Name'),
+    ]),
+    ("🔗 REPOSITORY INFORMATION", 25, [
+        ('github_username', "GitHub username", ('social', 'github'), 'yourusername'),
+        ('repo_name', "Repository name", None, 'jupyter-book-blog'),
+    ]),
+    ("📧 CONTACT INFORMATION (optional)", 33, [
+        ('email', "Email", ('social', 'email'), ''),
+        ('twitter', "Twitter username (without @)", ('social', 'twitter'), ''),
+        ('linkedin', "LinkedIn profile", ('social', 'linkedin'), ''),
+    ]),
+    ("🏠 HOMEPAGE SETTINGS", 19, [
+        ('welcome_text', "Welcome message", ('homepage', 'welcome_text'),
+         "Welcome to {blog_title}! This is where I share my thoughts, experiences, and insights on various topics."),
+    ]),
+    ("📝 POST SETTINGS", 16, [
+        ('max_posts', "Max posts on homepage (0 = all)", ('posts', 'max_posts_on_homepage'), '0'),
+    ]),
+]
+
+def get_config_value(config, key_path, default):
+    """Walk key_path into a nested config dict, returning default if any key is missing"""
+    if key_path is None:
+        return default
+    value = config
+    for key in key_path:
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
+
+def get_user_input(prompt, default="", interactive=True):
     """Get user input with optional default value"""
+    if not interactive:
+        return default
     if default:
         user_input = input(f"{prompt} [{default}]: ").strip()
         return user_input if user_input else default
     return input(f"{prompt}: ").strip()
 
-def yes_no_prompt(prompt, default=True):
+def yes_no_prompt(prompt, default=True, interactive=True):
     """Ask a yes/no question"""
+    if not interactive:
+        return default
     default_str = "Y/n" if default else "y/N"
     response = input(f"{prompt} [{default_str}]: ").strip().lower()
 
@@ -23,94 +109,56 @@ def yes_no_prompt(prompt, default=True):
         return default
     return response.startswith('y')
 
-def setup_blog():
-    """Interactive setup for blog configuration"""
+def setup_blog(interactive=True):
+    """Interactive setup for blog configuration.
+
+    With interactive=False every question takes its default (or the value
+    already in blog_config.json) without prompting.
+    """
     print("🚀 Welcome to Jupyter Book Blog Setup!")
     print("=" * 50)
     print("This script will help you customize your blog.")
-    print("Press Enter to use default values shown in brackets.\n")
+    if interactive:
+        print("Press Enter to use default values shown in brackets.\n")
+    else:
+        print("Running non-interactively: using existing or default values.\n")
 
     # Load existing config if it exists
     config_path = Path('blog_config.json')
     if config_path.exists():
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        if orjson is not None:
+            config = orjson.loads(config_path.read_bytes())
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
         print("📝 Found existing configuration. You can update the values below.\n")
     else:
         config = {}
 
-    # Get blog information
-    print("📖 BLOG INFORMATION")
-    print("-" * 20)
-
-    blog_title = get_user_input(
-        "Blog title",
-        config.get('blog', {}).get('title', 'My Technical Blog')
-    )
-
-    blog_description = get_user_input(
-        "Blog description",
-        config.get('blog', {}).get('description', 'A technical blog powered by Jupyter Book')
-    )
-
-    author_name = get_user_input(
-        "Author name",
-        config.get('blog', {}).get('author', 'Your Name')
-    )
-
-    print(f"\n🔗 REPOSITORY INFORMATION")
-    print("-" * 25)
-
-    github_username = get_user_input(
-        "GitHub username",
-        config.get('social', {}).get('github', 'yourusername')
-    )
-
-    repo_name = get_user_input(
-        "Repository name",
-        'jupyter-book-blog'
-    )
-
-    repository_url = f"https://github.com/{github_username}/{repo_name}"
-    website_url = f"https://{github_username}.github.io/{repo_name}"
-
-    print(f"\n📧 CONTACT INFORMATION (optional)")
-    print("-" * 33)
-
-    email = get_user_input(
-        "Email",
-        config.get('social', {}).get('email', '')
-    )
-
-    twitter = get_user_input(
-        "Twitter username (without @)",
-        config.get('social', {}).get('twitter', '')
-    )
-
-    linkedin = get_user_input(
-        "LinkedIn profile",
-        config.get('social', {}).get('linkedin', '')
-    )
-
-    print(f"\n🏠 HOMEPAGE SETTINGS")
-    print("-" * 19)
-
-    welcome_text = get_user_input(
-        "Welcome message",
-        config.get('homepage', {}).get('welcome_text',
-                  f"Welcome to {blog_title}! This is where I share my thoughts, experiences, and insights on various topics.")
-    )
-
-    print(f"\n📝 POST SETTINGS")
-    print("-" * 16)
-
-    max_posts = get_user_input(
-        "Max posts on homepage (0 = all)",
-        str(config.get('posts', {}).get('max_posts_on_homepage', 0))
-    )
+    answers = {}
+    for i, (heading, width, fields) in enumerate(SETUP_PROMPTS):
+        print(f"\n{heading}" if i else heading)
+        print("-" * width)
+        for name, prompt, key_path, default in fields:
+            default = get_config_value(config, key_path, default.format(**answers))
+            if isinstance(default, (int, float)):
+                default = str(default)
+            answers[name] = get_user_input(prompt, default, interactive)
+
+    blog_title = answers['blog_title']
+    blog_description = answers['blog_description']
+    author_name = answers['author_name']
+    github_username = answers['github_username']
+    email = answers['email']
+    twitter = answers['twitter']
+    linkedin = answers['linkedin']
+    welcome_text = answers['welcome_text']
+
+    repository_url = f"https://github.com/{github_username}/{answers['repo_name']}"
+    website_url = f"https://{github_username}.github.io/{answers['repo_name']}"
 
     try:
-        max_posts = int(max_posts)
+        max_posts = int(answers['max_posts'])
     except ValueError:
         max_posts = 0
 
@@ -119,7 +167,8 @@ def setup_blog():
 
     github_actions_enabled = yes_no_prompt(
         "Enable GitHub Actions automatic deployment?",
-        config.get('deployment', {}).get('github_actions', {}).get('enabled', False)
+        get_config_value(config, ('deployment', 'github_actions', 'enabled'), False),
+        interactive
     )
 
     # Build configuration
@@ -205,30 +254,29 @@ def setup_blog():
     }
 
     # Save configuration
-    with open('blog_config.json', 'w', encoding='utf-8') as f:
-        json.dump(new_config, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(new_config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(new_config, f, indent=2, ensure_ascii=False)
 
     print(f"\n✅ Configuration saved to blog_config.json")
 
     # Ask if user wants to apply changes
-    if yes_no_prompt("\n🔄 Apply configuration to all files now?", True):
+    if yes_no_prompt("\n🔄 Apply configuration to all files now?", True, interactive):
         print("\n📋 Applying configuration...")
 
-        import subprocess
-        import sys
-
         try:
-            # Run sync script
-            result = subprocess.run([sys.executable, 'scripts/sync_config.py'],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            # Run sync script in-process rather than paying for a new interpreter
+            success, output = run_script('sync_config', 'main', quiet=True)
+            if success:
                 print("✅ Configuration synced successfully!")
             else:
-                print(f"❌ Error syncing configuration: {result.stderr}")
+                print(f"❌ Error syncing configuration: {output}")
 
             # Run update scripts
-            subprocess.run([sys.executable, 'scripts/update_toc.py'])
-            subprocess.run([sys.executable, 'scripts/generate_posts.py'])
+            run_script('update_toc', 'update_toc')
+            run_script('generate_posts', 'update_index_md')
 
             print("\n🎉 Setup complete! Your blog is now customized.")
             print("\nNext steps:")
@@ -245,4 +293,10 @@ def setup_blog():
         print("Run 'python scripts/sync_config.py' when ready to apply changes.")
 
 if __name__ == "__main__":
-    setup_blog()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Customize your Jupyter Book blog.")
+    parser.add_argument('-y', '--non-interactive', '--yes', action='store_true',
+                        help="accept existing or default values without prompting")
+    args = parser.parse_args()
+
+    # Never block on input() when there is no terminal to answer it (e.g. CI)
+    setup_blog(interactive=not args.non_interactive and sys.stdin.isatty())
\ No newline at end of file
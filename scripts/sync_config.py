@@ -4,12 +4,26 @@ Script to sync blog_config.json settings with _config.yml and other files.
 Run this after updating blog_config.json to apply changes throughout the site.
 """
 
+import copy
+import fnmatch
+import glob
 import json
+import os
+import re
 import sys
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from blog_utils import read_json
+
+# libyaml's C loader/dumper when PyYAML was built with it, pure Python otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Number of lines at the top of index.md searched for the banner and welcome text
+INDEX_HEADER_LINES = 16
+
 
 def load_blog_config() -> Optional[Dict[str, Any]]:
     """Load blog configuration from blog_config.json"""
@@ -21,8 +35,7 @@ def load_blog_config() -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = read_json(config_path)
         print(f"✅ Loaded blog_config.json")
         return config
     except json.JSONDecodeError as e:
@@ -71,9 +84,11 @@ def discover_bib_files(config: Dict[str, Any]) -> list:
         # Scan for matching .bib files in posts/
         posts_dir = Path('posts')
         if posts_dir.exists():
-            for bib_file in posts_dir.glob('*.bib'):
-                if not bib_file.name.startswith('_'):
-                    bib_files.append(str(bib_file))
+            with os.scandir(posts_dir) as it:
+                for entry in it:
+                    if (entry.name.endswith('.bib') and not entry.name.startswith('_')
+                            and entry.is_file()):
+                        bib_files.append(entry.path)
         # Fallback to global if no per-post files found
         if not bib_files and Path(global_file).exists():
             bib_files.append(global_file)
@@ -83,20 +98,28 @@ def discover_bib_files(config: Dict[str, Any]) -> list:
         scan_patterns = bib_config.get('discovery', {}).get('scan_patterns',
                                                              ['references/*.bib', 'posts/*.bib'])
         exclude_patterns = bib_config.get('discovery', {}).get('exclude_patterns', [])
+        # Compile exclude patterns once; they are matched against each candidate's path
+        exclude_res = [re.compile(fnmatch.translate(p)) for p in exclude_patterns]
 
         for pattern in scan_patterns:
-            for bib_file in Path('.').glob(pattern):
-                # Check if file should be excluded
-                should_exclude = False
-                for exclude_pattern in exclude_patterns:
-                    if Path('.').glob(exclude_pattern):
-                        # Simple check: if filename starts with _ or matches exclude
-                        if bib_file.name.startswith('_') or 'backup' in bib_file.name.lower():
-                            should_exclude = True
-                            break
-
-                if not should_exclude and bib_file.is_file():
-                    bib_files.append(str(bib_file))
+            # Literal paths need a single stat, not a directory scan
+            if any(c in pattern for c in '*?['):
+                candidates = glob.iglob(pattern, recursive='**' in pattern)
+            else:
+                candidates = [pattern]
+
+            for bib_file in map(os.path.normpath, candidates):
+                # Check if file should be excluded: matches an exclude pattern, or
+                # (when exclusions are configured) looks like a private/backup file
+                name = os.path.basename(bib_file)
+                should_exclude = exclude_res and (
+                    any(r.match(bib_file) or r.match(name) for r in exclude_res)
+                    or name.startswith('_')
+                    or 'backup' in name.lower()
+                )
+
+                if not should_exclude and os.path.isfile(bib_file):
+                    bib_files.append(bib_file)
 
     else:  # mode == 'auto' or default
         # Auto mode: Try to find the best match
@@ -105,28 +128,27 @@ def discover_bib_files(config: Dict[str, Any]) -> list:
         # Check for per-post .bib files
         posts_dir = Path('posts')
         if posts_dir.exists():
-            for bib_file in posts_dir.glob('*.bib'):
-                if not bib_file.name.startswith('_'):
-                    bib_files.append(str(bib_file))
+            with os.scandir(posts_dir) as it:
+                for entry in it:
+                    if (entry.name.endswith('.bib') and not entry.name.startswith('_')
+                            and entry.is_file()):
+                        bib_files.append(entry.path)
 
         # Check for files in references/ directory
         refs_dir = Path('references')
         if refs_dir.exists():
-            for bib_file in refs_dir.glob('*.bib'):
-                if not bib_file.name.startswith('_'):
-                    bib_files.append(str(bib_file))
+            with os.scandir(refs_dir) as it:
+                for entry in it:
+                    if (entry.name.endswith('.bib') and not entry.name.startswith('_')
+                            and entry.is_file()):
+                        bib_files.append(entry.path)
 
         # Fallback to global file if nothing found
         if not bib_files and Path(global_file).exists():
             bib_files.append(global_file)
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_bib_files = []
-    for f in bib_files:
-        if f not in seen:
-            seen.add(f)
-            unique_bib_files.append(f)
+    unique_bib_files = list(dict.fromkeys(bib_files))
 
     if unique_bib_files:
         print(f"📚 Discovered {len(unique_bib_files)} bibliography file(s):")
@@ -151,19 +173,35 @@ def update_jupyter_book_config(config: Dict[str, Any]) -> bool:
         return False
 
     try:
-        # Read current config as YAML
-        with open(config_path, 'r', encoding='utf-8') as f:
-            jb_config = yaml.safe_load(f)
+        # Read the file once: the YAML is parsed from it and the comment
+        # header at the top is kept for writing back
+        original_content = config_path.read_text(encoding='utf-8')
+
+        header_lines = []
+        for line in original_content.split('\n'):
+            if line.strip().startswith('#'):
+                header_lines.append(line)
+            else:
+                break
+
+        jb_config = yaml.load(original_content, Loader=_YAML_LOADER)
 
         if jb_config is None:
             jb_config = {}
+        original_config = copy.deepcopy(jb_config)
 
         # Update title and author
-        jb_config['title'] = get_nested_value(config, 'blog', 'title', default='My Blog')
-        jb_config['author'] = get_nested_value(config, 'blog', 'author', default='Blog Author')
+        # Look up each config section once instead of re-walking the path per field;
+        # get_nested_value still treats a null value as missing
+        blog = get_nested_value(config, 'blog', default={})
+        urls = get_nested_value(config, 'urls', default={})
+        build = get_nested_value(config, 'build', default={})
+
+        jb_config['title'] = get_nested_value(blog, 'title', default='My Blog')
+        jb_config['author'] = get_nested_value(blog, 'author', default='Blog Author')
 
         # Handle logo (can be text or image)
-        logo_config = get_nested_value(config, 'blog', 'logo', default={})
+        logo_config = get_nested_value(blog, 'logo', default={})
         if isinstance(logo_config, dict):
             logo_type = logo_config.get('type', 'image')
             logo_value = logo_config.get('value', 'images/general/logo.png')
@@ -180,18 +218,16 @@ def update_jupyter_book_config(config: Dict[str, Any]) -> bool:
         # Update repository settings
         if 'repository' not in jb_config:
             jb_config['repository'] = {}
-        jb_config['repository']['url'] = get_nested_value(config, 'urls', 'repository',
-                                                           default='https://github.com/yourusername/repo')
-        jb_config['repository']['branch'] = get_nested_value(config, 'urls', 'branch', default='main')
+        repository_url = get_nested_value(urls, 'repository', default='https://github.com/yourusername/repo')
+        jb_config['repository']['url'] = repository_url
+        jb_config['repository']['branch'] = get_nested_value(urls, 'branch', default='main')
 
         # Update HTML settings
         if 'html' not in jb_config:
             jb_config['html'] = {}
 
-        jb_config['html']['favicon'] = get_nested_value(config, 'blog', 'favicon',
-                                                         default='images/general/logo.png')
-        jb_config['html']['baseurl'] = get_nested_value(config, 'urls', 'website',
-                                                          default='https://yourusername.github.io/repo')
+        jb_config['html']['favicon'] = get_nested_value(blog, 'favicon', default='images/general/logo.png')
+        jb_config['html']['baseurl'] = get_nested_value(urls, 'website', default='https://yourusername.github.io/repo')
 
         # Update GitHub buttons
         features = get_nested_value(config, 'features', 'github_buttons', default={})
@@ -210,27 +246,25 @@ def update_jupyter_book_config(config: Dict[str, Any]) -> bool:
             jb_config['sphinx']['config']['html_theme_options'] = {}
 
         theme_options = jb_config['sphinx']['config']['html_theme_options']
-        theme_options['repository_url'] = get_nested_value(config, 'urls', 'repository',
-                                                             default='https://github.com/yourusername/repo')
+        theme_options['repository_url'] = repository_url
         theme_options['use_repository_button'] = features.get('repository', True)
         theme_options['use_issues_button'] = features.get('issues', True)
         theme_options['use_edit_page_button'] = features.get('edit', True)
         theme_options['use_download_button'] = features.get('download', True)
 
         # Update copyright in footer
-        copyright_text = get_nested_value(config, 'blog', 'copyright',
-                                          default='© 2024 Blog Author. All rights reserved.')
+        copyright_text = get_nested_value(blog, 'copyright', default='© 2024 Blog Author. All rights reserved.')
         theme_options['extra_footer'] = f"<p>\n{copyright_text}\n</p>"
 
         # Update exclude patterns
-        exclude_patterns = get_nested_value(config, 'build', 'exclude_patterns',
-                                             default=['_build', 'Thumbs.db', '.DS_Store', '**.ipynb_checkpoints'])
+        exclude_patterns = get_nested_value(build, 'exclude_patterns',
+                                            default=['_build', 'Thumbs.db', '.DS_Store', '**.ipynb_checkpoints'])
         jb_config['exclude_patterns'] = exclude_patterns
 
         # Update execute notebooks setting
         if 'execute' not in jb_config:
             jb_config['execute'] = {}
-        execute_notebooks = get_nested_value(config, 'build', 'execute_notebooks', default='auto')
+        execute_notebooks = get_nested_value(build, 'execute_notebooks', default='auto')
         jb_config['execute']['execute_notebooks'] = execute_notebooks
 
         # Update bibliography settings
@@ -248,25 +282,22 @@ def update_jupyter_book_config(config: Dict[str, Any]) -> bool:
 
             jb_config['sphinx']['config']['bibtex_reference_style'] = citation_style
 
-        # Write updated config back to file
-        # First read the original file to preserve comments at the top
-        with open(config_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        # Leave the file (and its mtime) alone if the settings are unchanged, so
+        # Jupyter Book doesn't treat the whole site as dirty
+        if jb_config == original_config:
+            print("✅ _config.yml already up to date")
+            return True
 
-        # Extract the comment header (lines starting with #)
-        lines = original_content.split('\n')
-        header_lines = []
-        for line in lines:
-            if line.strip().startswith('#'):
-                header_lines.append(line)
-            else:
-                break
+        # Write header + updated YAML to a temp file and swap it in, so an
+        # interrupted run can't leave a truncated _config.yml behind
+        new_content = yaml.dump(jb_config, Dumper=_YAML_DUMPER, default_flow_style=False,
+                                allow_unicode=True, sort_keys=False)
+        if header_lines:
+            new_content = '\n'.join(header_lines) + '\n\n' + new_content
 
-        # Write header + updated YAML
-        with open(config_path, 'w', encoding='utf-8') as f:
-            if header_lines:
-                f.write('\n'.join(header_lines) + '\n\n')
-            yaml.dump(jb_config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        tmp_path = config_path.with_suffix('.yml.tmp')
+        tmp_path.write_text(new_content, encoding='utf-8')
+        os.replace(tmp_path, config_path)
 
         print("✅ Updated _config.yml")
         return True
@@ -289,8 +320,7 @@ def update_index_page(config: Dict[str, Any]) -> bool:
 
     try:
         # Read current index
-        with open(index_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = index_path.read_text(encoding='utf-8')
 
         lines = content.split('\n')
 
@@ -313,33 +343,37 @@ def update_index_page(config: Dict[str, Any]) -> bool:
             banner_line = f'**{banner_value}**'
         # else: banner_type == 'none', banner_line stays empty
 
-        # Find and update/remove existing banner
-        banner_found = False
-        for i, line in enumerate(lines):
-            if line.startswith('![') or (i > 0 and i < 5 and line.startswith('**') and line.endswith('**')):
-                if banner_line:
-                    lines[i] = banner_line
-                else:
-                    lines[i] = ''
-                banner_found = True
+        welcome_text = get_nested_value(config, 'homepage', 'welcome_text',
+                                        default='Welcome to my technical blog!')
+
+        # Find the existing banner and welcome text (line that starts with
+        # "Welcome to") in one pass; both live in the header at the top of the page
+        banner_index = None
+        welcome_index = None
+        for i, line in enumerate(lines[:INDEX_HEADER_LINES]):
+            if banner_index is None and (
+                    line.startswith('![') or (0 < i < 5 and line.startswith('**') and line.endswith('**'))):
+                banner_index = i
+            elif welcome_index is None and line.startswith('Welcome to'):
+                welcome_index = i
+            if banner_index is not None and welcome_index is not None:
                 break
 
-        # Add banner if not found and should be shown
-        if not banner_found and banner_line and len(lines) > 1:
+        # Update welcome text before a banner insert shifts the line numbers
+        if welcome_index is not None:
+            lines[welcome_index] = welcome_text
+
+        # Update/remove existing banner, or add it if not found and should be shown
+        if banner_index is not None:
+            lines[banner_index] = banner_line
+        elif banner_line and len(lines) > 1:
             lines.insert(1, '')
             lines.insert(2, banner_line)
 
-        # Update welcome text (line that starts with "Welcome to")
-        welcome_text = get_nested_value(config, 'homepage', 'welcome_text',
-                                        default='Welcome to my technical blog!')
-        for i, line in enumerate(lines):
-            if line.startswith('Welcome to'):
-                lines[i] = welcome_text
-                break
-
-        # Write updated index
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        # Write updated index, leaving the file untouched if nothing changed
+        new_content = '\n'.join(lines)
+        if new_content != content:
+            index_path.write_text(new_content, encoding='utf-8')
 
         print("✅ Updated index.md")
         return True
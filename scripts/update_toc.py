@@ -5,19 +5,49 @@ Reads navigation structure from blog_config.json.
 """
 
 import json
+import os
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any, Optional, List
 
 try:
-    import frontmatter
+    import yaml
 except ImportError:
-    print("❌ Error: python-frontmatter package not found")
-    print("Please install it: pip install python-frontmatter")
+    print("❌ Error: PyYAML package not found")
+    print("Please install it: pip install PyYAML")
     sys.exit(1)
 
+from blog_utils import load_json_cache, parse_date_with_formats, read_frontmatter, save_json_cache
+
+# Title heading and legacy "*Published: DATE*" line, compiled once per run
+_TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+_DATE_RE = re.compile(r'\*(?:Published: )?(.+?)\*')
+
+# Characters that can't appear in a plain (unquoted) YAML scalar in block context
+_YAML_UNSAFE_PLAIN_RE = re.compile(r'^[-?:,\[\]{}#&*!|>\'"%@`]|: |:$| #|[\x00-\x1f]')
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+# Markdown files in posts/ that are not blog posts
+SKIP_POST_FILES = frozenset({'references.md', 'README.md'})
+
+# Fixed preamble of the generated _toc.yml
+TOC_HEADER = """# Table of contents
+# Learn more at https://jupyterbook.org/customize/toc.html
+
+format: jb-book
+root: index
+
+parts:
+"""
+
+# Extracted title/date keyed by path, reused while a post's mtime and size are unchanged
+TOC_CACHE_PATH = Path('.toc_cache.json')
+
 
 def load_config() -> Dict[str, Any]:
     """Load blog configuration from blog_config.json"""
@@ -61,24 +91,36 @@ def extract_post_metadata(file_path: Path, config: Dict[str, Any]) -> Optional[D
     """Extract title and date from a markdown file."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
-
-        # Try to get metadata from frontmatter first
-        title = post.get('title')
-        date_str = post.get('date')
-
-        # Fallback to content parsing
-        content = post.content
+            metadata = read_frontmatter(f)
+
+            # Try to get metadata from frontmatter first
+            title = metadata.get('title')
+            date_str = metadata.get('date')
+
+            # Fallback to content parsing for whatever frontmatter is missing.
+            # The title heading and legacy *DATE* line sit at the top of a post,
+            # so the body is only read until both are found
+            need_title = not title
+            need_date = not date_str
+            for line in f:
+                if not (need_title or need_date):
+                    break
+
+                # Cheap literal checks rule out most lines before the regex engine runs
+                if need_title and line.startswith('# '):
+                    title_match = _TITLE_RE.match(line)
+                    if title_match:
+                        title = title_match.group(1)
+                        need_title = False
+
+                if need_date and '*' in line:
+                    date_match = _DATE_RE.search(line)
+                    if date_match:
+                        date_str = date_match.group(1)
+                        need_date = False
 
-        # Extract title if not in frontmatter
         if not title:
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            title = title_match.group(1) if title_match else file_path.stem.replace('-', ' ').title()
-
-        # Extract date if not in frontmatter (legacy format)
-        if not date_str:
-            date_match = re.search(r'\*(?:Published: )?(.+?)\*', content)
-            date_str = date_match.group(1) if date_match else None
+            title = file_path.stem.replace('-', ' ').title()
 
         if not date_str:
             print(f"⚠️  Warning: No date found in {file_path.name}, skipping")
@@ -107,15 +149,48 @@ def parse_date(date_str: str, config: Dict[str, Any]) -> datetime:
         config, 'posts', 'supported_date_formats',
         default=["%B %d, %Y", "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"]
     )
+    parsed = parse_date_with_formats(date_str, tuple(supported_formats))
+    if parsed is None:
+        print(f"⚠️  Warning: Could not parse date '{date_str}'")
+        return datetime.min
+    return parsed
+
 
-    for date_format in supported_formats:
-        try:
-            return datetime.strptime(date_str, date_format)
-        except ValueError:
-            continue
+@lru_cache(maxsize=None)
+def _toc_scalar(value: str) -> str:
+    """Render a string for _toc.yml, quoting it only when YAML would misread it plain.
 
-    print(f"⚠️  Warning: Could not parse date '{date_str}'")
-    return datetime.min
+    Values such as 'notes: draft', 'true' or '2024' would otherwise turn into
+    mappings, booleans or numbers when Jupyter Book loads the TOC.
+    """
+    value = str(value)
+    if (value and value == value.strip() and not _YAML_UNSAFE_PLAIN_RE.search(value)
+            and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == 'tag:yaml.org,2002:str'):
+        return value
+    # A JSON string literal is a valid double-quoted YAML scalar
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _build_toc_prefix(navigation: Dict[str, Any]) -> str:
+    """Render _toc.yml up to the first post entry, which depends only on the navigation settings."""
+    parts = [TOC_HEADER]
+
+    # Add Quick Links section from config
+    quick_links = get_nested_value(navigation, 'quick_links', default=[])
+    if quick_links:
+        parts.append("  - caption: Quick Links\n")
+        parts.append("    chapters:\n")
+        for link in quick_links:
+            file_name = link.get('file', '')
+            if file_name:
+                parts.append(f"      - file: {_toc_scalar(file_name)}\n")
+
+    # Add Blog Posts section
+    blog_section_title = get_nested_value(navigation, 'blog_section_title', default='Blog Posts')
+    parts.append(f"  - caption: {_toc_scalar(blog_section_title)}\n")
+    parts.append("    chapters:\n")
+
+    return ''.join(parts)
 
 
 def update_toc():
@@ -126,50 +201,59 @@ def update_toc():
     posts_dir = Path('posts')
     posts = []
 
-    # Scan for markdown files in posts directory
+    # Scan for markdown files in posts directory; unchanged posts are served
+    # from the cache using the stat info scandir hands back
     if posts_dir.exists():
-        for file_path in posts_dir.glob('*.md'):
-            if file_path.name not in ['references.md', 'README.md']:
-                metadata = extract_post_metadata(file_path, config)
-                if metadata:
-                    posts.append(metadata)
-
-    # Sort posts by date (newest first)
-    posts.sort(key=lambda x: parse_date(x['date'], config), reverse=True)
-
-    # Generate TOC content
-    toc_content = """# Table of contents
-# Learn more at https://jupyterbook.org/customize/toc.html
-
-format: jb-book
-root: index
-
-parts:
-"""
-
-    # Add Quick Links section from config
-    quick_links = get_nested_value(config, 'navigation', 'quick_links', default=[])
-    if quick_links:
-        toc_content += "  - caption: Quick Links\n"
-        toc_content += "    chapters:\n"
-        for link in quick_links:
-            file_name = link.get('file', '')
-            if file_name:
-                toc_content += f"      - file: {file_name}\n"
+        cache = load_json_cache(TOC_CACHE_PATH)
+        scanned = []
+        with os.scandir(posts_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.md') or not entry.is_file():
+                    continue
+                if entry.name not in SKIP_POST_FILES:
+                    stat = entry.stat()
+                    cached = cache.get(entry.path)
+                    if cached and cached.get('mtime') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+                        metadata = cached['meta']
+                    else:
+                        metadata = None
+                    scanned.append((entry.path, stat, metadata))
+
+        # Only posts missing from the cache are read, in parallel threads
+        stale_paths = [Path(path) for path, _, metadata in scanned if metadata is None]
+        with ThreadPoolExecutor() as executor:
+            extracted = iter(list(executor.map(lambda path: extract_post_metadata(path, config), stale_paths)))
+
+        new_cache = {}
+        for path, stat, metadata in scanned:
+            if metadata is None:
+                metadata = next(extracted)
+            if metadata:
+                posts.append(metadata)
+                new_cache[path] = {
+                    'mtime': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    # Frontmatter values may be dates or numbers; the TOC only uses their text
+                    'meta': {key: str(value) for key, value in metadata.items()}
+                }
+
+        if new_cache != cache:
+            save_json_cache(TOC_CACHE_PATH, new_cache)
+
+    # Parse each post's date once, then sort by it (newest first)
+    for post in posts:
+        post['date_dt'] = parse_date(post['date'], config)
+    posts.sort(key=itemgetter('date_dt'), reverse=True)
 
-    # Add Blog Posts section
-    blog_section_title = get_nested_value(config, 'navigation', 'blog_section_title', default='Blog Posts')
-    toc_content += f"  - caption: {blog_section_title}\n"
-    toc_content += "    chapters:\n"
+    # Generate TOC content: the fixed part depends only on the navigation config
+    parts = [_build_toc_prefix(get_nested_value(config, 'navigation', default={}))]
 
     # Add all posts to TOC
-    for post in posts:
-        toc_content += f"      - file: posts/{post['filename']}\n"
+    parts.extend(f"      - file: {_toc_scalar('posts/' + post['filename'])}\n" for post in posts)
 
     # Write updated TOC
     try:
-        with open('_toc.yml', 'w', encoding='utf-8') as f:
-            f.write(toc_content)
+        Path('_toc.yml').write_text(''.join(parts), encoding='utf-8')
 
         print(f"✅ Updated _toc.yml with {len(posts)} blog posts")
         if posts:
@@ -11,18 +11,22 @@ Checks for common issues:
 """
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, Set, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Set, List, Tuple, Optional
 
-try:
-    import frontmatter
-except ImportError:
-    print("❌ Error: python-frontmatter package not found")
-    print("Please install it: pip install python-frontmatter")
-    sys.exit(1)
+from blog_utils import read_frontmatter, skip_frontmatter
+
+# BibTeX entry header at the start of a line; spacing may not cross a line break
+_BIB_ENTRY_RE = re.compile(rb'^@\w+[^\S\n]*\{[^\S\n]*([^,\s]+)', re.MULTILINE)
+
+# {cite}`key` and {cite:t}`key1,key2` roles in post content, and the keys inside them
+_CITE_BLOCK_RE = re.compile(r'\{cite(?::t)?\}`([^`]+)`')
+_CITE_KEY_RE = re.compile(r'[^,\s]+')
 
 
 def load_config():
@@ -34,50 +38,131 @@ def load_config():
         return {}
 
 
-def find_bib_files():
+def find_bib_files() -> Tuple[Path, ...]:
     """Find all .bib files in the project."""
     bib_files = []
 
-    # Check references/ directory
-    refs_dir = Path('references')
-    if refs_dir.exists():
-        for bib_file in refs_dir.glob('**/*.bib'):
-            if not bib_file.name.startswith('_'):
-                bib_files.append(bib_file)
+    # Check references/ directory, including subdirectories
+    for dirpath, _, filenames in os.walk('references'):
+        for name in filenames:
+            if name.endswith('.bib') and not name.startswith('_'):
+                bib_files.append(Path(dirpath, name))
 
     # Check posts/ directory
-    posts_dir = Path('posts')
-    if posts_dir.exists():
-        for bib_file in posts_dir.glob('*.bib'):
-            if not bib_file.name.startswith('_'):
-                bib_files.append(bib_file)
+    if os.path.isdir('posts'):
+        with os.scandir('posts') as it:
+            for entry in it:
+                if entry.name.endswith('.bib') and not entry.name.startswith('_') and entry.is_file():
+                    bib_files.append(Path(entry.path))
 
-    return bib_files
+    return tuple(bib_files)
 
 
-def parse_bib_file(bib_file: Path) -> Dict[str, int]:
+def find_post_files() -> Tuple[Path, ...]:
+    """Find all markdown posts in posts/."""
+    if not os.path.isdir('posts'):
+        return ()
+    with os.scandir('posts') as it:
+        return tuple(Path(entry.path) for entry in it
+                     if entry.name.endswith('.md') and entry.is_file())
+
+
+def scan_bib(bib_file: Path) -> Tuple[Dict[str, int], int, int, bool]:
     """
-    Parse a .bib file and extract citation keys.
+    Read a .bib file once and collect everything the checks need from it.
 
     Returns:
-        Dict mapping citation key to line number
+        (keys mapping citation key to line number, open brace count,
+         close brace count, whether '@@' occurs)
     """
+    # Everything scanned for is ASCII, so work on the raw bytes and only
+    # decode the keys that are found. The file must still be valid UTF-8:
+    # decoding it once raises the same error read_text would, which
+    # check_bibtex_syntax reports
+    content = bib_file.read_bytes()
+    content.decode('utf-8')
+
+    # Match BibTeX entry at the start of a line: @article{key, @book{key, etc.
+    # Matches come in file order, so line numbers are found by counting only
+    # the newlines since the previous match
     keys = {}
-    try:
-        with open(bib_file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, start=1):
-                # Match BibTeX entry: @article{key, @book{key, etc.
-                match = re.match(r'@\w+\s*\{\s*([^,\s]+)', line)
-                if match:
-                    key = match.group(1)
-                    keys[key] = line_num
-    except Exception as e:
-        print(f"⚠️  Warning: Error parsing {bib_file}: {e}")
+    line_num = 1
+    pos = 0
+    for match in _BIB_ENTRY_RE.finditer(content):
+        line_num += content.count(b'\n', pos, match.start())
+        pos = match.start()
+        keys[match.group(1).decode('utf-8')] = line_num
+
+    return keys, content.count(b'{'), content.count(b'}'), b'@@' in content
+
+
+def _map_files(func, paths) -> List[Tuple[object, Optional[Exception]]]:
+    """
+    Apply func to each path on a thread pool.
+
+    Returns (result, None) or (None, exception) per path, in path order, so
+    callers can report failures from the main thread in a stable order.
+    """
+    def call(path):
+        try:
+            return func(path), None
+        except Exception as e:
+            return None, e
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(call, paths))
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write a check's report lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
 
-    return keys
+@dataclass
+class ValidationContext:
+    """Bibliography and citation data gathered once and shared by every check."""
+    bib_files: Tuple[Path, ...]
+    bib_scans: Dict[Path, Tuple[Dict[str, int], int, int, bool]]  # .bib file -> scan_bib result
+    bib_errors: Dict[Path, Exception]         # .bib file -> error reading it
+    keys_by_file: Dict[Path, Dict[str, int]]  # .bib file -> {key: line number}
+    defined: Dict[str, Path]                  # key -> .bib file defining it
+    post_files: Tuple[Path, ...]
+    post_cites: Dict[Path, Set[str]]          # post -> keys it cites
+    cited: Set[str]
 
 
-def check_duplicate_keys() -> Tuple[bool, List[str]]:
+def build_validation_context() -> ValidationContext:
+    """Discover and read every .bib file and post once for all the checks."""
+    bib_files = find_bib_files()
+
+    # Read every .bib file concurrently; results come back in file order
+    bib_scans = {}
+    bib_errors = {}
+    keys_by_file = {}
+    defined = {}
+    for bib_file, (scan, error) in zip(bib_files, _map_files(scan_bib, bib_files)):
+        if error is not None:
+            print(f"⚠️  Warning: Error parsing {bib_file}: {error}")
+            bib_errors[bib_file] = error
+            keys_by_file[bib_file] = {}
+            continue
+        bib_scans[bib_file] = scan
+        keys = keys_by_file[bib_file] = scan[0]
+        for key in keys:
+            defined[key] = bib_file
+
+    post_files = find_post_files()
+    post_cites = find_citations_in_posts(post_files)
+    cited = set()
+    for keys in post_cites.values():
+        cited.update(keys)
+
+    return ValidationContext(bib_files, bib_scans, bib_errors, keys_by_file, defined,
+                             post_files, post_cites, cited)
+
+
+def check_duplicate_keys(ctx: ValidationContext) -> Tuple[bool, List[str]]:
     """
     Check for duplicate citation keys across all .bib files.
 
@@ -86,40 +171,41 @@ def check_duplicate_keys() -> Tuple[bool, List[str]]:
     """
     print("\n🔍 Checking for duplicate citation keys...")
 
-    bib_files = find_bib_files()
-    if not bib_files:
+    if not ctx.bib_files:
         print("⚠️  No bibliography files found")
         return False, []
 
-    # Build mapping: key -> [(file, line_number), ...]
-    key_locations = defaultdict(list)
+    # Remember where each key is first defined; a list of locations is only
+    # built for keys seen again: key -> [(file, line_number), ...]
+    first = {}
+    dups = {}
 
-    for bib_file in bib_files:
-        keys = parse_bib_file(bib_file)
+    for bib_file, keys in ctx.keys_by_file.items():
         for key, line_num in keys.items():
-            key_locations[key].append((bib_file, line_num))
+            if key in first:
+                dups.setdefault(key, [first[key]]).append((bib_file, line_num))
+            else:
+                first[key] = (bib_file, line_num)
 
-    # Find duplicates
-    has_errors = False
+    # Report duplicates
+    has_errors = bool(dups)
     warnings = []
-    duplicates_found = 0
+    duplicates_found = len(dups)
 
-    for key, locations in key_locations.items():
-        if len(locations) > 1:
-            duplicates_found += 1
-            has_errors = True
-            warning = f"⚠️  Duplicate key '{key}' found in:"
-            warnings.append(warning)
-            print(warning)
-            for file_path, line_num in locations:
-                location = f"   - {file_path}:{line_num}"
-                warnings.append(location)
-                print(location)
-
-            # Suggest fix
-            suggestion = f"   💡 Suggestion: Use unique keys like '{key}_topic1', '{key}_topic2'"
-            warnings.append(suggestion)
-            print(suggestion)
+    # Report keys in the order they were first defined
+    for key in (first if dups else ()):
+        locations = dups.get(key)
+        if locations is None:
+            continue
+        warning = f"⚠️  Duplicate key '{key}' found in:"
+        warnings.append(warning)
+        for file_path, line_num in locations:
+            warnings.append(f"   - {file_path}:{line_num}")
+
+        # Suggest fix
+        warnings.append(f"   💡 Suggestion: Use unique keys like '{key}_topic1', '{key}_topic2'")
+
+    _write_lines(warnings)
 
     if not has_errors:
         print("✅ No duplicate citation keys found")
@@ -129,7 +215,7 @@ def check_duplicate_keys() -> Tuple[bool, List[str]]:
     return has_errors, warnings
 
 
-def check_bibtex_syntax() -> Tuple[bool, List[str]]:
+def check_bibtex_syntax(ctx: ValidationContext) -> Tuple[bool, List[str]]:
     """
     Check for basic BibTeX syntax errors.
 
@@ -138,83 +224,69 @@ def check_bibtex_syntax() -> Tuple[bool, List[str]]:
     """
     print("\n🔍 Checking BibTeX syntax...")
 
-    bib_files = find_bib_files()
     has_errors = False
     warnings = []
 
-    for bib_file in bib_files:
-        try:
-            with open(bib_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Basic syntax checks
-            open_braces = content.count('{')
-            close_braces = content.count('}')
-
-            if open_braces != close_braces:
-                has_errors = True
-                warning = f"⚠️  {bib_file}: Mismatched braces ({{: {open_braces}, }}: {close_braces})"
-                warnings.append(warning)
-                print(warning)
-
-            # Check for common issues
-            if '@@' in content:
-                has_errors = True
-                warning = f"⚠️  {bib_file}: Double @@ found (possible typo)"
-                warnings.append(warning)
-                print(warning)
+    for bib_file in ctx.bib_files:
+        error = ctx.bib_errors.get(bib_file)
+        if error is not None:
+            has_errors = True
+            warnings.append(f"❌ Error reading {bib_file}: {error}")
+            continue
 
-        except Exception as e:
+        # Basic syntax checks
+        _, open_braces, close_braces, has_double_at = ctx.bib_scans[bib_file]
+
+        if open_braces != close_braces:
             has_errors = True
-            warning = f"❌ Error reading {bib_file}: {e}"
-            warnings.append(warning)
-            print(warning)
+            warnings.append(f"⚠️  {bib_file}: Mismatched braces ({{: {open_braces}, }}: {close_braces})")
 
+        # Check for common issues
+        if has_double_at:
+            has_errors = True
+            warnings.append(f"⚠️  {bib_file}: Double @@ found (possible typo)")
+
+    _write_lines(warnings)
     if not has_errors:
         print("✅ No syntax errors found")
 
     return has_errors, warnings
 
 
-def find_citations_in_posts() -> Dict[Path, Set[str]]:
+def find_citations_in_posts(post_files: Tuple[Path, ...]) -> Dict[Path, Set[str]]:
     """
-    Find all citations used in blog posts.
+    Find all citations used in the given blog posts.
 
     Returns:
         Dict mapping post file to set of cited keys
     """
     citations = {}
-    posts_dir = Path('posts')
-
-    if not posts_dir.exists():
-        return citations
-
-    for post_file in posts_dir.glob('*.md'):
-        try:
-            with open(post_file, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-                content = post.content
 
-            # Find all {cite}`key` and {cite:t}`key` patterns
-            cite_pattern = r'\{cite(?::t)?\}`([^`]+)`'
-            matches = re.findall(cite_pattern, content)
+    # Posts are read concurrently; warnings are printed afterwards in post order
+    for post_file, (cited_keys, error) in zip(post_files, _map_files(_cited_keys_in_post, post_files)):
+        if error is not None:
+            print(f"⚠️  Warning: Error parsing {post_file}: {error}")
+        elif cited_keys:
+            citations[post_file] = cited_keys
 
-            # Split multiple citations: {cite}`key1,key2,key3`
-            cited_keys = set()
-            for match in matches:
-                keys = [k.strip() for k in match.split(',')]
-                cited_keys.update(keys)
+    return citations
 
-            if cited_keys:
-                citations[post_file] = cited_keys
 
-        except Exception as e:
-            print(f"⚠️  Warning: Error parsing {post_file}: {e}")
+def _cited_keys_in_post(post_file: Path) -> Set[str]:
+    """Return the citation keys used in a single post."""
+    # Only the body is searched, so the header is skipped without parsing it
+    with open(post_file, 'r', encoding='utf-8') as f:
+        skip_frontmatter(f)
+        content = f.read()
 
-    return citations
+    # Find all {cite}`key` and {cite:t}`key` patterns, and split multiple
+    # citations ({cite}`key1,key2,key3`) with a second regex
+    return {key
+            for block in _CITE_BLOCK_RE.findall(content)
+            for key in _CITE_KEY_RE.findall(block)}
 
 
-def check_orphaned_citations() -> Tuple[bool, List[str]]:
+def check_orphaned_citations(ctx: ValidationContext) -> Tuple[bool, List[str]]:
     """
     Check for citations used in posts but not defined in any .bib file.
 
@@ -223,39 +295,28 @@ def check_orphaned_citations() -> Tuple[bool, List[str]]:
     """
     print("\n🔍 Checking for orphaned citations...")
 
-    # Get all defined keys
-    bib_files = find_bib_files()
-    defined_keys = set()
-    for bib_file in bib_files:
-        keys = parse_bib_file(bib_file)
-        defined_keys.update(keys.keys())
-
-    # Get all cited keys
-    post_citations = find_citations_in_posts()
-
-    # Find orphaned citations
+    # Find orphaned citations across all posts at once; posts only need to
+    # be looked at individually when there are any
+    global_orphans = ctx.cited.difference(ctx.defined)
     has_warnings = False
     warnings = []
 
-    for post_file, cited_keys in post_citations.items():
-        orphaned = cited_keys - defined_keys
+    for post_file, cited_keys in (ctx.post_cites.items() if global_orphans else ()):
+        orphaned = cited_keys & global_orphans
         if orphaned:
             has_warnings = True
-            warning = f"⚠️  {post_file} cites undefined keys:"
-            warnings.append(warning)
-            print(warning)
+            warnings.append(f"⚠️  {post_file} cites undefined keys:")
             for key in sorted(orphaned):
-                key_warning = f"   - {key}"
-                warnings.append(key_warning)
-                print(key_warning)
+                warnings.append(f"   - {key}")
 
+    _write_lines(warnings)
     if not has_warnings:
         print("✅ All cited keys are defined")
 
     return has_warnings, warnings
 
 
-def check_unused_references() -> Tuple[bool, List[str]]:
+def check_unused_references(ctx: ValidationContext) -> Tuple[bool, List[str]]:
     """
     Check for references defined but never cited (informational only).
 
@@ -264,52 +325,31 @@ def check_unused_references() -> Tuple[bool, List[str]]:
     """
     print("\n🔍 Checking for unused references...")
 
-    # Get all defined keys
-    bib_files = find_bib_files()
-    defined_keys = {}  # key -> file
-    for bib_file in bib_files:
-        keys = parse_bib_file(bib_file)
-        for key in keys.keys():
-            defined_keys[key] = bib_file
-
-    # Get all cited keys
-    post_citations = find_citations_in_posts()
-    cited_keys = set()
-    for keys in post_citations.values():
-        cited_keys.update(keys)
-
     # Find unused
-    unused = set(defined_keys.keys()) - cited_keys
+    unused = ctx.defined.keys() - ctx.cited
 
     has_info = len(unused) > 0
     info_messages = []
 
     if unused:
-        info = f"ℹ️  Found {len(unused)} unused reference(s) (this is informational):"
-        info_messages.append(info)
-        print(info)
+        info_messages.append(f"ℹ️  Found {len(unused)} unused reference(s) (this is informational):")
 
         # Show first 10
         for key in sorted(list(unused)[:10]):
-            file_info = f"   - {key} in {defined_keys[key].name}"
-            info_messages.append(file_info)
-            print(file_info)
+            info_messages.append(f"   - {key} in {ctx.defined[key].name}")
 
         if len(unused) > 10:
-            more_info = f"   ... and {len(unused) - 10} more"
-            info_messages.append(more_info)
-            print(more_info)
+            info_messages.append(f"   ... and {len(unused) - 10} more")
 
-        tip = "   💡 Unused references are not an error - they may be for future use"
-        info_messages.append(tip)
-        print(tip)
+        info_messages.append("   💡 Unused references are not an error - they may be for future use")
+        _write_lines(info_messages)
     else:
         print("✅ All defined references are cited")
 
     return has_info, info_messages
 
 
-def check_missing_bib_files() -> Tuple[bool, List[str]]:
+def check_missing_bib_files(ctx: ValidationContext) -> Tuple[bool, List[str]]:
     """
     Check if posts reference .bib files that don't exist.
 
@@ -324,26 +364,29 @@ def check_missing_bib_files() -> Tuple[bool, List[str]]:
 
     has_errors = False
     warnings = []
+    lines = []  # warnings plus read errors, in post order
 
-    for post_file in posts_dir.glob('*.md'):
+    for post_file in ctx.post_files:
         try:
+            # Only the header is needed, so the post body is never read
             with open(post_file, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
+                metadata = read_frontmatter(f)
 
             # Check if post specifies a bibliography file
-            if 'bibliography' in post.metadata:
-                bib_file = post.metadata['bibliography']
+            if 'bibliography' in metadata:
+                bib_file = metadata['bibliography']
                 bib_path = Path(bib_file)
 
                 if not bib_path.exists():
                     has_errors = True
                     warning = f"⚠️  {post_file} references missing file: {bib_file}"
                     warnings.append(warning)
-                    print(warning)
+                    lines.append(warning)
 
         except Exception as e:
-            print(f"⚠️  Warning: Error parsing {post_file}: {e}")
+            lines.append(f"⚠️  Warning: Error parsing {post_file}: {e}")
 
+    _write_lines(lines)
     if not has_errors:
         print("✅ All referenced bibliography files exist")
 
@@ -356,6 +399,9 @@ def main():
     print("=" * 50)
 
     config = load_config()
+
+    ctx = build_validation_context()
+
     if config.get('bibliography', {}).get('validation', {}).get('strict_mode'):
         print("ℹ️  Running in STRICT mode (all warnings are errors)\n")
         strict = True
@@ -366,26 +412,26 @@ def main():
     all_warnings = []
 
     # Run checks
-    errors, warnings = check_duplicate_keys()
+    errors, warnings = check_duplicate_keys(ctx)
     if errors:
         all_errors.extend(warnings)
     else:
         all_warnings.extend(warnings)
 
-    errors, warnings = check_bibtex_syntax()
+    errors, warnings = check_bibtex_syntax(ctx)
     if errors:
         all_errors.extend(warnings)
 
-    errors, warnings = check_missing_bib_files()
+    errors, warnings = check_missing_bib_files(ctx)
     if errors:
         all_errors.extend(warnings)
 
-    errors, warnings = check_orphaned_citations()
+    errors, warnings = check_orphaned_citations(ctx)
     if errors:
         all_errors.extend(warnings)
 
     # Unused references is informational only
-    _, info = check_unused_references()
+    _, info = check_unused_references(ctx)
 
     # Summary
     print("\n" + "=" * 50)